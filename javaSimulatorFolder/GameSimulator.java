@@ -1,4 +1,7 @@
 import java.util.*;
+import java.util.function.Consumer;
+import java.util.regex.Pattern;
+import java.util.stream.IntStream;
 import java.io.*;
 
 /**
@@ -9,52 +12,125 @@ public class GameSimulator {
     private static final int DEFAULT_TURN_LIMIT = 15;
     private static final int DEFAULT_BUDGET = 200;
 
-    protected final Tile[][] grid;
+    // Tile type codes, stored per cell in tileType (same order as TileType)
+    static final byte TILE_EMPTY = 0;
+    static final byte TILE_SMALL_BUILDING = 1;
+    static final byte TILE_BIG_BUILDING = 2;
+    static final byte TILE_POWER_PLANT = 3;
+    static final byte TILE_MUD = 4;
+    static final byte TILE_SPIKE_TRAP = 5;
+    static final byte TILE_BOULDER = 6;
+    static final byte TILE_CAT_BED = 7;
+    static final byte TILE_WALL = 8;
+
+    private static final TileType[] TILE_TYPES = TileType.values();
+
+    // Cat status codes, stored per cat in catStatus (same order as CatStatus)
+    static final byte STATUS_ACTIVE = 0;
+    static final byte STATUS_STUCK_MUD = 1;
+    static final byte STATUS_STOMPING = 2;
+    static final byte STATUS_FINISHED = 3;
+    static final byte STATUS_DEFEATED = 4;
+
+    static final CatStatus[] CAT_STATUSES = CatStatus.values();
+
+    // Layout code -> (tile type << 24) | (power per floor << 8) | floors
+    private static final Map<String, Integer> TILE_CODES;
+    private static final Map<String, CatColor> CAT_START_CODES;
+    private static final Map<String, CatColor> CAT_BED_CODES;
+
+    static {
+        Map<String, Integer> tileCodes = new HashMap<>();
+        tileCodes.put(".", packTile(TILE_EMPTY, 0, 0));
+        tileCodes.put("h", packTile(TILE_SMALL_BUILDING, 250, 1)); // Small, 1 floor
+        tileCodes.put("hh", packTile(TILE_SMALL_BUILDING, 250, 2)); // Small, 2 floors
+        tileCodes.put("H", packTile(TILE_BIG_BUILDING, 500, 1)); // Big, 1 floor
+        tileCodes.put("HH", packTile(TILE_BIG_BUILDING, 500, 2)); // Big, 2 floors
+        tileCodes.put("P", packTile(TILE_POWER_PLANT, 0, 1)); // Single use, tracked as one floor
+        tileCodes.put("X", packTile(TILE_BOULDER, 0, 0));
+        tileCodes.put("S", packTile(TILE_SPIKE_TRAP, 0, 0));
+        tileCodes.put("M", packTile(TILE_MUD, 0, 0));
+        tileCodes.put("#", packTile(TILE_WALL, 0, 0));
+        TILE_CODES = Collections.unmodifiableMap(tileCodes);
+
+        Map<String, CatColor> catStartCodes = new HashMap<>();
+        catStartCodes.put("RStart", CatColor.RED);
+        catStartCodes.put("GStart", CatColor.GREEN);
+        catStartCodes.put("BStart", CatColor.BLUE);
+        CAT_START_CODES = Collections.unmodifiableMap(catStartCodes);
+
+        Map<String, CatColor> catBedCodes = new HashMap<>();
+        catBedCodes.put("RBed", CatColor.RED);
+        catBedCodes.put("UI_R", CatColor.RED);
+        catBedCodes.put("GBed", CatColor.GREEN);
+        catBedCodes.put("UI_G", CatColor.GREEN);
+        catBedCodes.put("BBed", CatColor.BLUE);
+        catBedCodes.put("UI_B", CatColor.BLUE);
+        CAT_BED_CODES = Collections.unmodifiableMap(catBedCodes);
+    }
+
+    private static final CatColor[] CAT_COLORS = CatColor.values();
+    private static final String[] CAT_GLYPHS = {"R", "G", "B"}; // By CatColor ordinal
+    private static final int MAX_FLOORS = 2;
+
+    // Command codes stored per floor: 0 = no command, otherwise CommandType ordinal + 1
+    private static final CommandType[] COMMAND_TYPES = CommandType.values();
+    private static final byte CMD_NONE = 0;
+    private static final byte CMD_STOMP = (byte) (CommandType.STOMP.ordinal() + 1);
+    private static final byte CMD_POWERUP = (byte) (CommandType.POWERUP.ordinal() + 1);
+
+    // Turn direction per command code, (0, 0) for commands that do not turn the cat
+    private static final int[] COMMAND_DX = new int[COMMAND_TYPES.length + 1];
+    private static final int[] COMMAND_DY = new int[COMMAND_TYPES.length + 1];
+
+    static {
+        for (CommandType type : COMMAND_TYPES) {
+            Direction direction = type.getDirection();
+            if (direction != null) {
+                COMMAND_DX[type.ordinal() + 1] = direction.getDx();
+                COMMAND_DY[type.ordinal() + 1] = direction.getDy();
+            }
+        }
+    }
+
+    // Board state as flat parallel arrays indexed y * width + x
+    protected final byte[] tileType;
+    protected final int[] floorPower;
+    protected final int[] totalFloors;
+    protected final int[] remainingFloors;
+    protected final byte[] floorCommands; // Command code at index * MAX_FLOORS + floor, floor 0 = bottom
+    protected final byte[] bedOwner; // CatColor ordinal of the bed on each tile, -1 if none
+    private final String[] baseGlyphs; // Display chars of the board as parsed
     protected final int width;
     protected final int height;
-    protected final Map<CatColor, Cat> cats;
-    private final Map<CatColor, Position> catBeds;
+    // Cat state as parallel arrays indexed by cat slot (present cats in CatColor order)
+    protected final int catCount;
+    protected final CatColor[] catColor;
+    protected final int[] catX;
+    protected final int[] catY;
+    protected final int[] catDx;
+    protected final int[] catDy;
+    protected final int[] catPower;
+    protected final int[] catHierarchy;
+    protected final byte[] catStatus; // STATUS_* codes
+    private final int[] moveOrder;
+
+    // Per-turn collision grid: bit i set when cat slot i is on the tile (at most 3 cats)
+    private final byte[] occupantMask;
+
+    protected final Map<CatColor, Cat> cats; // Read-only views over the cat arrays
     protected int turn;
     protected final int turnLimit;
     protected final int startingBudget;
     protected int totalCommandCost;
     private int globalBedArrivalCounter;
     
+    private final Snapshot initialState;
+
     // For visualization
     private final List<GameState> stateHistory;
     private boolean trackHistory;
-
-    // ============================================================================
-    // POSITION HELPER CLASS
-    // ============================================================================
-
-    private static class Position {
-        final int x;
-        final int y;
-
-        Position(int x, int y) {
-            this.x = x;
-            this.y = y;
-        }
-
-        @Override
-        public boolean equals(Object o) {
-            if (this == o) return true;
-            if (!(o instanceof Position)) return false;
-            Position position = (Position) o;
-            return x == position.x && y == position.y;
-        }
-
-        @Override
-        public int hashCode() {
-            return Objects.hash(x, y);
-        }
-
-        @Override
-        public String toString() {
-            return "(" + x + "," + y + ")";
-        }
-    }
+    private String[][] gridDisplay; // Render buffer reused across turns, allocated on first use
 
     // ============================================================================
     // CONSTRUCTOR AND INITIALIZATION
@@ -75,9 +151,16 @@ public class GameSimulator {
     public GameSimulator(String[][] layout, int startingBudget, int turnLimit, boolean trackHistory) {
         this.height = layout.length;
         this.width = layout[0].length;
-        this.grid = new Tile[height][width];
-        this.cats = new HashMap<>();
-        this.catBeds = new HashMap<>();
+        int tiles = height * width;
+        this.tileType = new byte[tiles];
+        this.floorPower = new int[tiles];
+        this.totalFloors = new int[tiles];
+        this.remainingFloors = new int[tiles];
+        this.floorCommands = new byte[tiles * MAX_FLOORS];
+        this.bedOwner = new byte[tiles];
+        Arrays.fill(bedOwner, (byte) -1);
+        this.baseGlyphs = new String[tiles];
+        this.cats = new EnumMap<>(CatColor.class);
         this.turn = 0;
         this.turnLimit = turnLimit;
         this.startingBudget = startingBudget;
@@ -86,103 +169,102 @@ public class GameSimulator {
         this.trackHistory = trackHistory;
         this.stateHistory = trackHistory ? new ArrayList<>() : null;
 
-        parseLayout(layout);
-        
+        // Start positions by color ordinal as y * width + x, -1 if the cat is absent
+        int[] catStarts = new int[CAT_COLORS.length];
+        Arrays.fill(catStarts, -1);
+        parseLayout(layout, catStarts);
+
+        int count = 0;
+        for (int start : catStarts) {
+            if (start >= 0) {
+                count++;
+            }
+        }
+        this.catCount = count;
+        this.catColor = new CatColor[count];
+        this.catX = new int[count];
+        this.catY = new int[count];
+        this.catDx = new int[count];
+        this.catDy = new int[count];
+        this.catPower = new int[count];
+        this.catHierarchy = new int[count];
+        this.catStatus = new byte[count];
+        this.moveOrder = new int[count];
+        this.occupantMask = new byte[tiles];
+
+        int slot = 0;
+        for (CatColor color : CAT_COLORS) {
+            int start = catStarts[color.ordinal()];
+            if (start < 0) {
+                continue;
+            }
+            catColor[slot] = color;
+            catX[slot] = start % width;
+            catY[slot] = start / width;
+            catDx[slot] = Direction.EAST.getDx();
+            catDy[slot] = Direction.EAST.getDy();
+            catPower[slot] = color.getInitialPower();
+            catHierarchy[slot] = color.getHierarchy();
+            catStatus[slot] = STATUS_ACTIVE;
+            cats.put(color, new Cat(this, slot));
+            slot++;
+        }
+
+        this.initialState = snapshot();
+
         if (trackHistory) {
             captureState();
         }
     }
 
-    private void parseLayout(String[][] layout) {
+    private void parseLayout(String[][] layout, int[] catStarts) {
         for (int y = 0; y < height; y++) {
             for (int x = 0; x < width; x++) {
                 String code = layout[y][x];
-                parseTile(code, x, y);
+                parseTile(code, x, y, catStarts);
+                baseGlyphs[y * width + x] = displayChar(y * width + x);
             }
         }
     }
 
-    private void parseTile(String code, int x, int y) {
-        // Cat starting positions
-        if (code.equals("RStart")) {
-            cats.put(CatColor.RED, new Cat(CatColor.RED, x, y, Direction.EAST));
-            grid[y][x] = new EmptyTile();
+    private void parseTile(String code, int x, int y, int[] catStarts) {
+        Integer packed = TILE_CODES.get(code);
+        if (packed != null) {
+            int tile = packed;
+            setTile(x, y, (byte) (tile >>> 24), (tile >>> 8) & 0xFFFF, tile & 0xFF);
             return;
         }
-        if (code.equals("GStart")) {
-            cats.put(CatColor.GREEN, new Cat(CatColor.GREEN, x, y, Direction.EAST));
-            grid[y][x] = new EmptyTile();
-            return;
-        }
-        if (code.equals("BStart")) {
-            cats.put(CatColor.BLUE, new Cat(CatColor.BLUE, x, y, Direction.EAST));
-            grid[y][x] = new EmptyTile();
+
+        // Cat starting positions
+        CatColor start = CAT_START_CODES.get(code);
+        if (start != null) {
+            catStarts[start.ordinal()] = y * width + x;
+            setTile(x, y, TILE_EMPTY, 0, 0);
             return;
         }
 
         // Cat beds
-        if (code.equals("RBed") || code.equals("UI_R")) {
-            catBeds.put(CatColor.RED, new Position(x, y));
-            grid[y][x] = new CatBedTile(CatColor.RED);
-            return;
-        }
-        if (code.equals("GBed") || code.equals("UI_G")) {
-            catBeds.put(CatColor.GREEN, new Position(x, y));
-            grid[y][x] = new CatBedTile(CatColor.GREEN);
-            return;
-        }
-        if (code.equals("BBed") || code.equals("UI_B")) {
-            catBeds.put(CatColor.BLUE, new Position(x, y));
-            grid[y][x] = new CatBedTile(CatColor.BLUE);
+        CatColor bed = CAT_BED_CODES.get(code);
+        if (bed != null) {
+            setTile(x, y, TILE_CAT_BED, 0, 0);
+            bedOwner[y * width + x] = (byte) bed.ordinal();
             return;
         }
 
-        // Houses (buildings)
-        if (code.equals("h")) {
-            grid[y][x] = new BuildingTile(true, 1); // Small, 1 floor
-            return;
-        }
-        if (code.equals("hh")) {
-            grid[y][x] = new BuildingTile(true, 2); // Small, 2 floors
-            return;
-        }
-        if (code.equals("H")) {
-            grid[y][x] = new BuildingTile(false, 1); // Big, 1 floor
-            return;
-        }
-        if (code.equals("HH")) {
-            grid[y][x] = new BuildingTile(false, 2); // Big, 2 floors
-            return;
-        }
+        // Default to empty for unknown codes
+        setTile(x, y, TILE_EMPTY, 0, 0);
+    }
 
-        // Special tiles
-        if (code.equals("P")) {
-            grid[y][x] = new PowerPlantTile();
-            return;
-        }
-        if (code.equals("X")) {
-            grid[y][x] = new BoulderTile();
-            return;
-        }
-        if (code.equals("S")) {
-            grid[y][x] = new SpikeTrapTile();
-            return;
-        }
-        if (code.equals("M")) {
-            grid[y][x] = new MudTile();
-            return;
-        }
-        if (code.equals("#")) {
-            grid[y][x] = new WallTile();
-            return;
-        }
-        if (code.equals(".")) {
-            grid[y][x] = new EmptyTile();
-            return;
-        }
+    private void setTile(int x, int y, byte type, int power, int floors) {
+        int index = y * width + x;
+        tileType[index] = type;
+        floorPower[index] = power;
+        totalFloors[index] = floors;
+        remainingFloors[index] = floors;
+    }
 
-        // Default to empty for unknown codes
-        grid[y][x] = new EmptyTile();
+    private static int packTile(byte type, int power, int floors) {
+        return (type << 24) | (power << 8) | floors;
     }
 
     // ============================================================================
@@ -198,27 +280,34 @@ public class GameSimulator {
             return false;
         }
 
-        Tile tile = grid[y][x];
-
-        if (!tile.canHoldCommand()) {
+        int index = y * width + x;
+        if (!canHoldCommand(index)) {
             return false;
         }
 
-        Command command = new Command(commandType);
-        int commandCost = command.getCost();
+        int commandCost = commandType.getCost();
 
         // Check budget
         if (totalCommandCost + commandCost > startingBudget) {
             return false;
         }
 
-        // Place the command
-        boolean success = tile.placeCommand(command, floor);
-        if (success) {
-            totalCommandCost += commandCost;
+        // Power plants hold a single command regardless of floor
+        if (tileType[index] == TILE_POWER_PLANT) {
+            floor = 0;
+        } else if (floor < 0 || floor >= remainingFloors[index]) {
+            return false;
         }
 
-        return success;
+        floorCommands[index * MAX_FLOORS + floor] = (byte) (commandType.ordinal() + 1);
+        totalCommandCost += commandCost;
+        return true;
+    }
+
+    private boolean canHoldCommand(int index) {
+        byte type = tileType[index];
+        return (type == TILE_SMALL_BUILDING || type == TILE_BIG_BUILDING || type == TILE_POWER_PLANT)
+                && remainingFloors[index] > 0;
     }
 
     public int getBudgetRemaining() {
@@ -232,122 +321,170 @@ public class GameSimulator {
     public void simulateTurn() {
         turn++;
 
-        // Phase 1: Planning & Target Calculation
-        List<CatMovement> movements = new ArrayList<>();
-
-        for (Cat cat : cats.values()) {
-            if (cat.getStatus() == CatStatus.ACTIVE) {
-                int targetX = cat.getX() + cat.getDirection().getDx();
-                int targetY = cat.getY() + cat.getDirection().getDy();
-                movements.add(new CatMovement(cat, targetX, targetY));
-            } else if (cat.getStatus() == CatStatus.STUCK_MUD) {
+        // Phase 1: Planning - resolve mud and stomping, and insert each moving cat
+        // into moveOrder by current power (lowest first for arrival order, stable on ties)
+        int moverCount = 0;
+        for (int i = 0; i < catCount; i++) {
+            if (catStatus[i] == STATUS_ACTIVE) {
+                int n = moverCount++;
+                while (n > 0 && catPower[moveOrder[n - 1]] > catPower[i]) {
+                    moveOrder[n] = moveOrder[n - 1];
+                    n--;
+                }
+                moveOrder[n] = i;
+            } else if (catStatus[i] == STATUS_STUCK_MUD) {
                 // Cat is stuck, skip movement but clear stuck status
-                cat.setStatus(CatStatus.ACTIVE);
-            } else if (cat.getStatus() == CatStatus.STOMPING) {
+                catStatus[i] = STATUS_ACTIVE;
+            } else if (catStatus[i] == STATUS_STOMPING) {
                 // Cat is stomping, stay in place and destroy next floor
-                Tile currentTile = getTile(cat.getX(), cat.getY());
-                if (currentTile != null) {
-                    // Apply effects to destroy next floor
-                    currentTile.applyEffects(cat);
-                }
+                applyTileEffects(catY[i] * width + catX[i], i);
                 // Stomping only lasts one turn, then return to active
-                cat.setStatus(CatStatus.ACTIVE);
+                catStatus[i] = STATUS_ACTIVE;
             }
         }
 
-        // Phase 2: Movement & Tile Interaction Resolution
-        // Sort by current power (lowest first for arrival order)
-        movements.sort(Comparator.comparingInt(m -> m.cat.getCurrentPower()));
+        // Phase 2: Movement & Fight Resolution
+        for (int m = 0; m < moverCount; m++) {
+            int i = moveOrder[m];
+            int targetX = catX[i] + catDx[i];
+            int targetY = catY[i] + catDy[i];
 
-        Map<Position, List<Cat>> tileOccupants = new HashMap<>();
+            // Handle impassable tiles (Boulder, Wall, out of bounds)
+            if (!isPassable(targetX, targetY)) {
+                // Rebound: reverse direction and stay at current position
+                catDx[i] = -catDx[i];
+                catDy[i] = -catDy[i];
+            } else {
+                catX[i] = targetX;
+                catY[i] = targetY;
+            }
 
-        // Store which cats rebounded (hit boundary/wall)
-        Set<Cat> reboundedCats = new HashSet<>();
+            // Fight Resolution (BEFORE tile effects): an arrival on an occupied
+            // tile fights the cat holding it, leaving only the winner's bit set
+            int index = catY[i] * width + catX[i];
+            int mask = occupantMask[index];
+            occupantMask[index] = (byte) (mask == 0 ? 1 << i : resolveFight(mask | 1 << i));
+        }
 
-        for (CatMovement movement : movements) {
-            Cat cat = movement.cat;
-            int targetX = movement.targetX;
-            int targetY = movement.targetY;
+        // Phase 3: Apply Tile Effects (AFTER combat, only for non-defeated cats)
+        for (int m = 0; m < moverCount; m++) {
+            int i = moveOrder[m];
 
-            Tile targetTile = getTile(targetX, targetY);
+            // Rebounded cats apply effects from their current position
+            int index = catY[i] * width + catX[i];
 
-            // Handle impassable tiles (Boulder, Wall, out of bounds)
-            if (targetTile == null || !targetTile.isPassable()) {
-                // Rebound: reverse direction
-                cat.reverseDirection();
-                // Stay at current position
-                Position currentPos = new Position(cat.getX(), cat.getY());
-                tileOccupants.computeIfAbsent(currentPos, k -> new ArrayList<>()).add(cat);
-                reboundedCats.add(cat);
+            // Clear the collision grid for the next turn (losers share the winner's tile)
+            occupantMask[index] = 0;
+
+            // Skip defeated cats
+            if (catStatus[i] == STATUS_DEFEATED) {
                 continue;
             }
 
-            // Move cat to target position
-            cat.setPosition(targetX, targetY);
-
-            // Track occupants for fight resolution
-            Position targetPos = new Position(targetX, targetY);
-            tileOccupants.computeIfAbsent(targetPos, k -> new ArrayList<>()).add(cat);
+            // Apply tile effects only to surviving cats
+            if (isPassable(tileType[index])) {
+                applyTileEffects(index, i);
+
+                // Check for cat bed arrival (bedOwner is -1 on every other tile)
+                if (bedOwner[index] == catColor[i].ordinal()) {
+                    catStatus[i] = STATUS_FINISHED;
+                    globalBedArrivalCounter++;
+
+                    // Apply arrival bonus
+                    if (globalBedArrivalCounter == 1) {
+                        catPower[i] += 2000;
+                    } else if (globalBedArrivalCounter == 2) {
+                        catPower[i] *= 3;
+                    } else if (globalBedArrivalCounter == 3) {
+                        catPower[i] *= 5;
+                    }
+                }
+            }
         }
 
-        // Phase 3: Fight Resolution (BEFORE tile effects)
-        for (List<Cat> catsAtTile : tileOccupants.values()) {
-            if (catsAtTile.size() > 1) {
-                // Find winner (highest power, ties broken by hierarchy)
-                Cat winner = catsAtTile.stream()
-                        .max(Comparator.comparingInt(Cat::getCurrentPower)
-                                .thenComparingInt(c -> -c.getHierarchy()))
-                        .orElse(null);
+        if (trackHistory) {
+            captureState();
+        }
+    }
 
-                for (Cat cat : catsAtTile) {
-                    if (cat != winner) {
-                        cat.setStatus(CatStatus.DEFEATED);
-                        cat.setPower(0); // Defeated cats lose all power
-                    }
-                }
+    private int resolveFight(int mask) {
+        int winner = -1;
+        for (int i = 0; i < catCount; i++) {
+            if ((mask >> i & 1) != 0 && (winner < 0 || fightKey(i) > fightKey(winner))) {
+                winner = i;
             }
         }
 
-        // Phase 4: Apply Tile Effects (AFTER combat, only for non-defeated cats)
-        for (CatMovement movement : movements) {
-            Cat cat = movement.cat;
-            
-            // Skip defeated cats
-            if (cat.getStatus() == CatStatus.DEFEATED) {
-                continue;
+        for (int i = 0; i < catCount; i++) {
+            if ((mask >> i & 1) != 0 && i != winner) {
+                catStatus[i] = STATUS_DEFEATED;
+                catPower[i] = 0; // Defeated cats lose all power
             }
+        }
+        return 1 << winner;
+    }
 
-            // Rebounded cats apply effects from their current position
-            int effectX = cat.getX();
-            int effectY = cat.getY();
-            Tile effectTile = getTile(effectX, effectY);
+    private long fightKey(int cat) {
+        // Highest power wins, ties broken by lowest hierarchy (power is never negative)
+        return ((long) catPower[cat] << 8) | (0xFF - catHierarchy[cat]);
+    }
 
-            // Apply tile effects only to surviving cats
-            if (effectTile != null && effectTile.isPassable()) {
-                effectTile.applyEffects(cat);
-
-                // Check for cat bed arrival
-                if (effectTile instanceof CatBedTile) {
-                    CatBedTile bedTile = (CatBedTile) effectTile;
-                    if (bedTile.getAssociatedCat() == cat.getColor()) {
-                        cat.setStatus(CatStatus.FINISHED);
-                        globalBedArrivalCounter++;
-
-                        // Apply arrival bonus
-                        if (globalBedArrivalCounter == 1) {
-                            cat.addPower(2000);
-                        } else if (globalBedArrivalCounter == 2) {
-                            cat.multiplyPower(3);
-                        } else if (globalBedArrivalCounter == 3) {
-                            cat.multiplyPower(5);
-                        }
+    private void applyTileEffects(int index, int cat) {
+        switch (tileType[index]) {
+            case TILE_SMALL_BUILDING:
+            case TILE_BIG_BUILDING: {
+                int floors = remainingFloors[index];
+                // Only destroy floor if we have floors remaining
+                if (floors > 0) {
+                    // Get top floor command
+                    int cmd = floorCommands[index * MAX_FLOORS + floors - 1];
+
+                    // Award power for destroying this floor, then destroy it
+                    catPower[cat] += floorPower[index];
+                    remainingFloors[index] = floors - 1;
+
+                    if (cmd != CMD_NONE) {
+                        executeCommand(cmd, cat, floors - 1 > 0);
                     }
                 }
+                break;
             }
+            case TILE_POWER_PLANT:
+                if (remainingFloors[index] > 0) {
+                    // Double the cat's power
+                    catPower[cat] *= 2;
+                    remainingFloors[index] = 0;
+
+                    int cmd = floorCommands[index * MAX_FLOORS];
+                    if (cmd != CMD_NONE) {
+                        // STOMP has no effect on a power plant (single use)
+                        executeCommand(cmd, cat, false);
+                    }
+                }
+                break;
+            case TILE_MUD:
+                catStatus[cat] = STATUS_STUCK_MUD;
+                break;
+            case TILE_SPIKE_TRAP:
+                catPower[cat] /= 2;
+                break;
+            default:
+                // Empty tiles and beds have no effect; arrival bonus handled by caller
+                break;
         }
-        
-        if (trackHistory) {
-            captureState();
+    }
+
+    private void executeCommand(int cmd, int cat, boolean floorsRemaining) {
+        if (COMMAND_DX[cmd] != 0 || COMMAND_DY[cmd] != 0) {
+            catDx[cat] = COMMAND_DX[cmd];
+            catDy[cat] = COMMAND_DY[cmd];
+        } else if (cmd == CMD_STOMP) {
+            // Set cat to STOMPING status if there are more floors to destroy
+            if (floorsRemaining) {
+                catStatus[cat] = STATUS_STOMPING;
+            }
+        } else if (cmd == CMD_POWERUP) {
+            catPower[cat] += 1000;
         }
     }
 
@@ -364,117 +501,191 @@ public class GameSimulator {
             simulateTurn();
 
             // Check if all cats are finished or defeated
-            if (cats.values().stream().allMatch(cat ->
-                    cat.getStatus() == CatStatus.FINISHED || cat.getStatus() == CatStatus.DEFEATED)) {
+            if (allCatsDone()) {
                 break;
             }
         }
 
         // Calculate final score
-        return cats.values().stream()
-                .mapToInt(Cat::getCurrentPower)
-                .sum();
+        return getTotalPower();
     }
 
-    public int runSimulation(boolean verbose, String outputFile) {
-        List<String> outputLines = new ArrayList<>();
+    /**
+     * Run one silent simulation per strategy in parallel and return the scores in order.
+     * Uses the default budget and turn limit.
+     */
+    public static int[] runBatch(String[][] layout, List<? extends Consumer<GameSimulator>> strategies) {
+        return runBatch(layout, DEFAULT_BUDGET, DEFAULT_TURN_LIMIT, strategies);
+    }
 
-        if (verbose || outputFile != null) {
-            printState(true, outputLines);
-        }
+    /**
+     * Run one silent simulation per strategy in parallel and return the scores in order.
+     * Strategies are split into contiguous chunks; each chunk parses the layout once and
+     * places each strategy's commands on a reset simulator.
+     */
+    public static int[] runBatch(String[][] layout, int startingBudget, int turnLimit,
+                                 List<? extends Consumer<GameSimulator>> strategies) {
+        int[] scores = new int[strategies.size()];
+        int chunks = Math.min(scores.length, Runtime.getRuntime().availableProcessors() * 4);
+
+        IntStream.range(0, chunks).parallel().forEach(chunk -> {
+            GameSimulator simulator = new GameSimulator(layout, startingBudget, turnLimit);
+            int start = (int) ((long) scores.length * chunk / chunks);
+            int end = (int) ((long) scores.length * (chunk + 1) / chunks);
+            for (int i = start; i < end; i++) {
+                simulator.reset();
+                strategies.get(i).accept(simulator);
+                scores[i] = simulator.runSimulationSilent();
+            }
+        });
 
-        for (int i = 1; i <= turnLimit; i++) {
-            simulateTurn();
+        return scores;
+    }
 
-            if (verbose || outputFile != null) {
-                printState(false, outputLines);
-            }
+    /**
+     * Run throwaway simulations so HotSpot compiles the turn loop before timed runs.
+     * Short benchmarks otherwise measure mostly interpreted code. Pass the same command
+     * placement as the timed runs so the command paths are compiled too.
+     * Uses the default budget and turn limit.
+     */
+    public static void warmUp(String[][] layout, Consumer<GameSimulator> workload, int iterations) {
+        warmUp(layout, DEFAULT_BUDGET, DEFAULT_TURN_LIMIT, workload, iterations);
+    }
 
-            // Check if all cats are finished or defeated
-            if (cats.values().stream().allMatch(cat ->
-                    cat.getStatus() == CatStatus.FINISHED || cat.getStatus() == CatStatus.DEFEATED)) {
-                break;
-            }
+    /**
+     * Warm up with the budget and turn limit of the timed runs, so the workload's
+     * command placements succeed or fail the same way they will when timed.
+     */
+    public static void warmUp(String[][] layout, int startingBudget, int turnLimit,
+                              Consumer<GameSimulator> workload, int iterations) {
+        GameSimulator simulator = new GameSimulator(layout, startingBudget, turnLimit);
+        for (int i = 0; i < iterations; i++) {
+            simulator.reset();
+            workload.accept(simulator);
+            simulator.runSimulationSilent();
         }
+    }
 
-        // Calculate final score
-        int totalScore = cats.values().stream()
-                .mapToInt(Cat::getCurrentPower)
-                .sum();
-
-        if (verbose || outputFile != null) {
-            outputLines.add("\n" + "=".repeat(60));
-            outputLines.add("SIMULATION COMPLETE");
-            outputLines.add("=".repeat(60));
-            for (Cat cat : cats.values()) {
-                outputLines.add(cat.toString());
+    public int runSimulation(boolean verbose, String outputFile) {
+        int totalScore;
+
+        try (PrintWriter writer = openOutputFile(outputFile)) {
+            // Stream each line to the console and/or file as it is produced
+            boolean printing = verbose || writer != null;
+            Consumer<String> output = line -> {
+                if (verbose) {
+                    System.out.println(line);
+                }
+                if (writer != null) {
+                    writer.println(line);
+                }
+            };
+
+            if (printing) {
+                printState(true, output);
             }
-            outputLines.add("\nFinal Total Score: " + totalScore);
-            outputLines.add("Budget Used: $" + totalCommandCost + " / $" + startingBudget);
-            outputLines.add("Budget Remaining: $" + getBudgetRemaining());
-        }
 
-        // Print to console if verbose
-        if (verbose) {
-            for (String line : outputLines) {
-                System.out.println(line);
+            for (int i = 1; i <= turnLimit; i++) {
+                simulateTurn();
+
+                if (printing) {
+                    printState(false, output);
+                }
+
+                // Check if all cats are finished or defeated
+                if (allCatsDone()) {
+                    break;
+                }
             }
-        }
 
-        // Write to file if specified
-        if (outputFile != null) {
-            try (PrintWriter writer = new PrintWriter(new FileWriter(outputFile))) {
-                for (String line : outputLines) {
-                    writer.println(line);
+            // Calculate final score
+            totalScore = getTotalPower();
+
+            if (printing) {
+                output.accept("\n" + "=".repeat(60));
+                output.accept("SIMULATION COMPLETE");
+                output.accept("=".repeat(60));
+                for (Cat cat : cats.values()) {
+                    output.accept(cat.toString());
                 }
-                if (verbose) {
+                output.accept("\nFinal Total Score: " + totalScore);
+                output.accept("Budget Used: $" + totalCommandCost + " / $" + startingBudget);
+                output.accept("Budget Remaining: $" + getBudgetRemaining());
+            }
+
+            if (writer != null) {
+                if (writer.checkError()) {
+                    System.err.println("Error writing to file: " + outputFile);
+                } else if (verbose) {
                     System.out.println("\n>>> Simulation output written to " + outputFile);
                 }
-            } catch (IOException e) {
-                System.err.println("Error writing to file: " + e.getMessage());
             }
         }
 
         return totalScore;
     }
 
-    private void printState(boolean initial, List<String> output) {
+    private static PrintWriter openOutputFile(String outputFile) {
+        if (outputFile == null) {
+            return null;
+        }
+        try {
+            return new PrintWriter(new BufferedWriter(new FileWriter(outputFile)));
+        } catch (IOException e) {
+            System.err.println("Error writing to file: " + e.getMessage());
+            return null;
+        }
+    }
+
+    private void printState(boolean initial, Consumer<String> output) {
         if (initial) {
-            output.add("=".repeat(60));
-            output.add("INITIAL STATE");
-            output.add("=".repeat(60));
+            output.accept("=".repeat(60));
+            output.accept("INITIAL STATE");
+            output.accept("=".repeat(60));
         } else {
-            output.add("\n" + "=".repeat(60));
-            output.add("TURN " + turn);
-            output.add("=".repeat(60));
+            output.accept("\n" + "=".repeat(60));
+            output.accept("TURN " + turn);
+            output.accept("=".repeat(60));
         }
 
         for (Cat cat : cats.values()) {
-            output.add(cat.toString());
+            output.accept(cat.toString());
         }
 
         // Print grid
-        output.add("\nGrid:");
-        String[][] gridDisplay = new String[height][width];
+        output.accept("\nGrid:");
+        for (String[] row : renderGrid()) {
+            output.accept(String.join(" ", row));
+        }
+    }
+
+    /**
+     * Render the board into the shared gridDisplay buffer. The returned grid is
+     * overwritten by the next call, so callers that keep it must copy it.
+     */
+    private String[][] renderGrid() {
+        if (gridDisplay == null) {
+            gridDisplay = new String[height][width];
+        }
 
-        // Initialize with tile display characters
+        // Only tiles that lost floors since parsing need a fresh display char
         for (int y = 0; y < height; y++) {
             for (int x = 0; x < width; x++) {
-                gridDisplay[y][x] = grid[y][x].getDisplayChar();
+                int index = y * width + x;
+                gridDisplay[y][x] = remainingFloors[index] == totalFloors[index]
+                        ? baseGlyphs[index]
+                        : displayChar(index);
             }
         }
 
         // Mark cats (override tiles) - use uppercase to distinguish from houses
-        for (Cat cat : cats.values()) {
-            if (cat.getStatus() != CatStatus.DEFEATED) {
-                gridDisplay[cat.getY()][cat.getX()] = cat.getColor().name().substring(0, 1); // Keep uppercase
+        for (int i = 0; i < catCount; i++) {
+            if (catStatus[i] != STATUS_DEFEATED) {
+                gridDisplay[catY[i]][catX[i]] = CAT_GLYPHS[catColor[i].ordinal()];
             }
         }
 
-        // Print grid
-        for (String[] row : gridDisplay) {
-            output.add(String.join(" ", row));
-        }
+        return gridDisplay;
     }
 
     // ============================================================================
@@ -485,26 +696,155 @@ public class GameSimulator {
         return x >= 0 && x < width && y >= 0 && y < height;
     }
 
-    private Tile getTile(int x, int y) {
-        if (isWithinBounds(x, y)) {
-            return grid[y][x];
+    private boolean allCatsDone() {
+        for (int i = 0; i < catCount; i++) {
+            if (catStatus[i] != STATUS_FINISHED && catStatus[i] != STATUS_DEFEATED) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    private int getTotalPower() {
+        int total = 0;
+        for (int i = 0; i < catCount; i++) {
+            total += catPower[i];
+        }
+        return total;
+    }
+
+    private boolean isPassable(int x, int y) {
+        return isWithinBounds(x, y) && isPassable(tileType[y * width + x]);
+    }
+
+    private static boolean isPassable(byte type) {
+        return type != TILE_BOULDER && type != TILE_WALL;
+    }
+
+    public TileType getTileType(int x, int y) {
+        return TILE_TYPES[tileType[checkedIndex(x, y)]];
+    }
+
+    public int getRemainingFloors(int x, int y) {
+        return remainingFloors[checkedIndex(x, y)];
+    }
+
+    public String getDisplayChar(int x, int y) {
+        return displayChar(checkedIndex(x, y));
+    }
+
+    // Flat index for public accessors; out-of-range coordinates would alias another tile
+    private int checkedIndex(int x, int y) {
+        if (!isWithinBounds(x, y)) {
+            throw new IndexOutOfBoundsException("Tile (" + x + ", " + y + ") is outside the "
+                    + width + "x" + height + " board");
+        }
+        return y * width + x;
+    }
+
+    private String displayChar(int index) {
+        switch (tileType[index]) {
+            case TILE_SMALL_BUILDING:
+            case TILE_BIG_BUILDING: {
+                int floors = remainingFloors[index];
+                if (floors == 0) {
+                    return ".";
+                }
+                String prefix = tileType[index] == TILE_SMALL_BUILDING ? "h" : "H";
+                return totalFloors[index] > 1 ? prefix + floors : prefix;
+            }
+            case TILE_POWER_PLANT:
+                return remainingFloors[index] > 0 ? "P" : ".";
+            case TILE_MUD: return "M";
+            case TILE_SPIKE_TRAP: return "S";
+            case TILE_BOULDER: return "X";
+            case TILE_WALL: return "#";
+            case TILE_CAT_BED:
+                switch (CAT_COLORS[bedOwner[index]]) {
+                    case RED: return "UI_R";
+                    case GREEN: return "UI_G";
+                    case BLUE: return "UI_B";
+                    default: return "BED";
+                }
+            default: return ".";
         }
-        return null;
     }
 
     // ============================================================================
-    // INNER CLASS FOR MOVEMENT TRACKING
+    // SNAPSHOT AND RESET
     // ============================================================================
 
-    private static class CatMovement {
-        final Cat cat;
-        final int targetX;
-        final int targetY;
+    /**
+     * Copy of all mutable game state: floors, commands, cats, budget and turn.
+     * History is not included. Only valid for the simulator that created it.
+     */
+    public static final class Snapshot {
+        private final GameSimulator owner;
+        private final int[] remainingFloors;
+        private final byte[] floorCommands;
+        private final int[] catX;
+        private final int[] catY;
+        private final int[] catDx;
+        private final int[] catDy;
+        private final int[] catPower;
+        private final byte[] catStatus;
+        private final int turn;
+        private final int totalCommandCost;
+        private final int globalBedArrivalCounter;
+
+        private Snapshot(GameSimulator sim) {
+            this.owner = sim;
+            this.remainingFloors = sim.remainingFloors.clone();
+            this.floorCommands = sim.floorCommands.clone();
+            this.catX = sim.catX.clone();
+            this.catY = sim.catY.clone();
+            this.catDx = sim.catDx.clone();
+            this.catDy = sim.catDy.clone();
+            this.catPower = sim.catPower.clone();
+            this.catStatus = sim.catStatus.clone();
+            this.turn = sim.turn;
+            this.totalCommandCost = sim.totalCommandCost;
+            this.globalBedArrivalCounter = sim.globalBedArrivalCounter;
+        }
+    }
+
+    /**
+     * Capture the current state, e.g. before trying a candidate command placement.
+     */
+    public Snapshot snapshot() {
+        return new Snapshot(this);
+    }
+
+    /**
+     * Restore a snapshot taken from this simulator by copying into the existing arrays.
+     * Recorded history is left as is. Snapshots from other simulators are rejected.
+     */
+    public void restore(Snapshot snapshot) {
+        if (snapshot.owner != this) {
+            throw new IllegalArgumentException("Snapshot was taken from a different simulator");
+        }
+        System.arraycopy(snapshot.remainingFloors, 0, remainingFloors, 0, remainingFloors.length);
+        System.arraycopy(snapshot.floorCommands, 0, floorCommands, 0, floorCommands.length);
+        System.arraycopy(snapshot.catX, 0, catX, 0, catCount);
+        System.arraycopy(snapshot.catY, 0, catY, 0, catCount);
+        System.arraycopy(snapshot.catDx, 0, catDx, 0, catCount);
+        System.arraycopy(snapshot.catDy, 0, catDy, 0, catCount);
+        System.arraycopy(snapshot.catPower, 0, catPower, 0, catCount);
+        System.arraycopy(snapshot.catStatus, 0, catStatus, 0, catCount);
+        this.turn = snapshot.turn;
+        this.totalCommandCost = snapshot.totalCommandCost;
+        this.globalBedArrivalCounter = snapshot.globalBedArrivalCounter;
+    }
 
-        CatMovement(Cat cat, int targetX, int targetY) {
-            this.cat = cat;
-            this.targetX = targetX;
-            this.targetY = targetY;
+    /**
+     * Return to the freshly parsed layout (no commands, full budget, turn 0)
+     * without re-parsing. Use this to reuse one simulator across many runs.
+     */
+    public void reset() {
+        restore(initialState);
+        if (trackHistory) {
+            stateHistory.clear();
+            captureState();
         }
     }
 
@@ -556,21 +896,13 @@ public class GameSimulator {
             ));
         }
 
-        String[][] gridSnapshot = new String[height][width];
+        String[][] grid = renderGrid();
+        String[][] gridCopy = new String[height][];
         for (int y = 0; y < height; y++) {
-            for (int x = 0; x < width; x++) {
-                gridSnapshot[y][x] = grid[y][x].getDisplayChar();
-            }
-        }
-
-        // Mark cats on grid - use uppercase to distinguish from houses
-        for (Cat cat : cats.values()) {
-            if (cat.getStatus() != CatStatus.DEFEATED) {
-                gridSnapshot[cat.getY()][cat.getX()] = cat.getColor().name().substring(0, 1); // Keep uppercase
-            }
+            gridCopy[y] = grid[y].clone();
         }
 
-        stateHistory.add(new GameState(turn, catStates, gridSnapshot));
+        stateHistory.add(new GameState(turn, catStates, gridCopy));
     }
 
     public List<GameState> getHistory() {
@@ -589,7 +921,44 @@ public class GameSimulator {
     // FILE LOADING
     // ============================================================================
 
+    private static final Pattern BOARD_DECLARATION = Pattern.compile("String\\[\\]\\[\\]\\s+board\\s*=\\s*");
+    private static final Pattern ROW_SEPARATOR = Pattern.compile("\\},\\s*\\{");
+    private static final Pattern CELL_SEPARATOR = Pattern.compile(",\\s*");
+    private static final Pattern BRACES = Pattern.compile("[{}]");
+
+    // Parsed layouts by path, reused while the file's modification time is unchanged
+    private static final int LAYOUT_CACHE_SIZE = 8;
+    private static final Map<String, CachedLayout> layoutCache =
+            new LinkedHashMap<String, CachedLayout>(16, 0.75f, true) {
+                @Override
+                protected boolean removeEldestEntry(Map.Entry<String, CachedLayout> eldest) {
+                    return size() > LAYOUT_CACHE_SIZE;
+                }
+            };
+
+    private static class CachedLayout {
+        final long lastModified;
+        final String[][] layout;
+
+        CachedLayout(long lastModified, String[][] layout) {
+            this.lastModified = lastModified;
+            this.layout = layout;
+        }
+    }
+
+    /**
+     * Load a layout in Java array format. Repeated loads of an unchanged file
+     * return the same cached array, so callers must not modify it.
+     */
     public static String[][] loadLayoutFromFile(String filename) throws IOException {
+        long lastModified = new File(filename).lastModified();
+        synchronized (layoutCache) {
+            CachedLayout cached = layoutCache.get(filename);
+            if (cached != null && cached.lastModified == lastModified) {
+                return cached.layout;
+            }
+        }
+
         try (BufferedReader reader = new BufferedReader(new FileReader(filename))) {
             StringBuilder content = new StringBuilder();
             String line;
@@ -598,12 +967,15 @@ public class GameSimulator {
             }
 
             // Parse the layout
-            String layoutStr = content.toString()
-                    .replaceAll("String\\[\\]\\[\\]\\s+board\\s*=\\s*", "")
-                    .replaceAll(";", "")
+            String layoutStr = BOARD_DECLARATION.matcher(content).replaceAll("")
+                    .replace(";", "")
                     .trim();
 
-            return parseLayoutString(layoutStr);
+            String[][] layout = parseLayoutString(layoutStr);
+            synchronized (layoutCache) {
+                layoutCache.put(filename, new CachedLayout(lastModified, layout));
+            }
+            return layout;
         }
     }
 
@@ -614,15 +986,15 @@ public class GameSimulator {
         layoutStr = layoutStr.substring(layoutStr.indexOf('{') + 1, layoutStr.lastIndexOf('}'));
 
         // Split by rows
-        String[] rowStrings = layoutStr.split("\\},\\s*\\{");
+        String[] rowStrings = ROW_SEPARATOR.split(layoutStr);
 
         for (String rowStr : rowStrings) {
-            rowStr = rowStr.replaceAll("[{}]", "").trim();
-            String[] cells = rowStr.split(",\\s*");
+            rowStr = BRACES.matcher(rowStr).replaceAll("").trim();
+            String[] cells = CELL_SEPARATOR.split(rowStr);
 
             // Remove quotes from each cell
             for (int i = 0; i < cells.length; i++) {
-                cells[i] = cells[i].replaceAll("\"", "").trim();
+                cells[i] = cells[i].replace("\"", "").trim();
             }
 
             rows.add(cells);
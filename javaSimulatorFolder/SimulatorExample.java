@@ -1,4 +1,5 @@
 import java.io.*;
+import java.util.function.Consumer;
 
 /**
  * Example usage of the GameSimulator
@@ -48,16 +49,26 @@ public class SimulatorExample {
         System.out.println("2. Running PERFORMANCE MODE (fast, no output)");
         System.out.println("-".repeat(60));
         
+        // Commands placed on every run (same as before)
+        Consumer<GameSimulator> placeCommands = sim -> {
+            sim.placeCommand(1, 0, CommandType.TURN_S);
+            sim.placeCommand(5, 0, CommandType.POWERUP);
+        };
+
+        // Let the JIT compile the simulator on the same workload before timing
+        GameSimulator.warmUp(layout, placeCommands, 10000);
+
         long startTime = System.currentTimeMillis();
         int runs = 10000;
         
+        // Create one simulator (no history tracking) and reset it between runs
+        GameSimulator fastSimulator = new GameSimulator(layout);
+        
         for (int run = 0; run < runs; run++) {
-            // Create new simulator (no history tracking)
-            GameSimulator fastSimulator = new GameSimulator(layout);
+            fastSimulator.reset();
             
-            // Place commands (same as before)
-            fastSimulator.placeCommand(1, 0, CommandType.TURN_S);
-            fastSimulator.placeCommand(5, 0, CommandType.POWERUP);
+            // Place commands
+            placeCommands.accept(fastSimulator);
             
             // Run silently - just get the score
             int score = fastSimulator.runSimulationSilent();